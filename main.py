@@ -1,20 +1,20 @@
-import subprocess
+import os
 import sys
 
-def run_script(script):
-    result = subprocess.run([sys.executable, script])
-    if result.returncode != 0:
-        print(f"Erreur lors de l'exécution de {script}")
-        exit(result.returncode)
+sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+from gather_events import main as gather
+from rate_events import main as rate
+from viz import main as viz
 
 def main():
     # Exécuter le workflow de collecte d'événements
-    run_script("src/gather_events.py")
-        
-    # Exécuter le workflow de notation des événements
-    run_script("src/rate_events.py")
+    gather()
+
     # Exécuter le workflow de notation des événements
-    run_script("src/viz.py")
+    rate()
+
+    # Exécuter le workflow de visualisation des événements
+    viz()
     
 if __name__ == "__main__":
     main()
@@ -1,27 +1,41 @@
+import asyncio
 import json
 import os
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import re
+import shutil
+import sqlite3
+import time
+import aiohttp
+import lxml.html
 from dotenv import load_dotenv
+from contextlib import closing
 from datetime import datetime  # import ajouté
-from bs4 import BeautifulSoup  # import ajouté pour améliorer le parsing HTML
-
-def setup_driver(headless=False):
-    """Initialize and return a Chrome WebDriver instance."""
-    chrome_options = Options()
-    if headless:
-        chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+from pathlib import Path
+
+# Table de la page de liste dont l'en-tête contient "Event" (le HTML brut n'a pas
+# forcément de <tbody>, contrairement au DOM du navigateur)
+EVENT_TABLE_XPATH = "//table[(tbody/tr | tr)[1]/td[contains(., 'Event')]]"
+# Lien vers la page suivante de la liste
+NEXT_PAGE_XPATH = "//a[normalize-space(text())='next']/@href"
+# Nombre maximal de pages de détail téléchargées en parallèle
+DETAIL_CONCURRENCY = 20
+# Délai maximal (en secondes) pour télécharger une page
+HTTP_TIMEOUT = 15
+# Durée de validité (en secondes) d'une page de détail dans le cache
+DETAIL_CACHE_TTL = 7 * 24 * 3600
+DETAILS_TABLE_SQL = (
+    "CREATE TABLE IF NOT EXISTS details "
+    "(url TEXT PRIMARY KEY, payload TEXT NOT NULL, fetched_at INTEGER NOT NULL)"
+)
+# Premier lien de la cellule qui contient le texte "Link:" (site web de l'événement)
+WEBSITE_LINK_XPATH = "(//text()[contains(., 'Link:')])[1]/ancestor::td[1]//a/@href"
+
+# Expressions régulières compilées une seule fois pour toutes les pages de détail
+_DEADLINE_RE = re.compile(r"Deadline\s*:\s*([\w\s,\-]+)", re.IGNORECASE)
+_REVIEW_TIME_RE = re.compile(r"Review Time\s*:\s*([\w\s,\-]+)", re.IGNORECASE)
+_CONFERENCE_RANK_RE = re.compile(r"Conference Rank\s*:\s*([\w\s,\-]+)", re.IGNORECASE)
+_MINIMUM_PAGES_RE = re.compile(r"Minimum Pages\s*:\s*(\d+)", re.IGNORECASE)
+_WORKSHOP_RE = re.compile(r"\bworkshops?\b", re.IGNORECASE)
 
 def format_deadline(deadline_str):
     """Format deadline string to standard format."""
@@ -36,9 +50,9 @@ def format_deadline(deadline_str):
     except ValueError:
         return deadline_str
 
-def process_data_table(driver):
+def process_data_table(tree):
     """
-    Locate the data table by its header and extract event data.
+    Locate the data table by its header in a parsed listing page and extract event data.
     Each event spans two rows:
       - Row 1: Contains the event name (with a link) and description.
       - Row 2: Contains "When", "Where", and "Deadline" details.
@@ -47,19 +61,14 @@ def process_data_table(driver):
         A list of dictionaries containing extracted event data.
     """
     events = []
-    try:
-        # Wait until the table with header "Event" is available.
-        table = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located(
-                (By.XPATH, "//table[tbody/tr[1]/td[contains(., 'Event')]]")
-            )
-        )
-    except Exception as e:
-        print("Error locating the data table:", e)
+    tables = tree.xpath(EVENT_TABLE_XPATH)
+    if not tables:
+        print("Error locating the data table.")
         return events
+    table = tables[0]
 
     # Fetch all rows in the table
-    rows = table.find_elements(By.XPATH, ".//tr")
+    rows = table.xpath(".//tr")
     if len(rows) < 3:
         print("Not enough rows found in the table.")
         return events
@@ -70,34 +79,32 @@ def process_data_table(driver):
     for i in range(1, len(rows), 2):
         try:
             # First row for the event record
-            row1 = rows[i]
-            cells1 = row1.find_elements(By.TAG_NAME, "td")
+            cells1 = rows[i].xpath("./td")
             if len(cells1) < 2:
                 print("Insufficient cells in the first row of the record.")
                 continue
 
             # Extract event name and link from the first cell
-            try:
-                link_elem = cells1[0].find_element(By.TAG_NAME, "a")
-                event_name = link_elem.text.strip()
-                event_link = link_elem.get_attribute("href")
-            except Exception as e:
-                print("Error extracting event link:", e)
-                event_name = cells1[0].text.strip()
+            links = cells1[0].xpath(".//a[@href]")
+            if links:
+                event_name = links[0].text_content().strip()
+                event_link = links[0].get("href")
+            else:
+                print("Error extracting event link: no link in the first cell")
+                event_name = cells1[0].text_content().strip()
                 event_link = "N/A"
 
             # Extract description from the second cell.
-            description = cells1[1].text.strip() if len(cells1) >= 2 else "N/A"
+            description = cells1[1].text_content().strip()
 
             # Second row contains When, Where, and Deadline details.
             when = where = deadline = "N/A"
             if i + 1 < len(rows):
-                row2 = rows[i + 1]
-                cells2 = row2.find_elements(By.TAG_NAME, "td")
+                cells2 = rows[i + 1].xpath("./td")
                 if len(cells2) >= 3:
-                    when = cells2[0].text.strip()
-                    where = cells2[1].text.strip()
-                    deadline = format_deadline(cells2[2].text.strip())
+                    when = cells2[0].text_content().strip()
+                    where = cells2[1].text_content().strip()
+                    deadline = format_deadline(cells2[2].text_content().strip())
 
             event_data = {
                 "event_name": event_name,
@@ -113,90 +120,193 @@ def process_data_table(driver):
             continue
     return events
 
-def click_next_page(driver):
+def find_next_page(tree):
     """
-    Check for a clickable "next" link in the pagination area and click it.
-    Returns True if the next page is loaded, or False if not found.
+    Return the absolute URL of the "next" link of a parsed listing page,
+    or None if this is the last page.
     """
-    try:
-        # Look for an anchor tag with text "next".
-        next_link = WebDriverWait(driver, 5).until(
-            EC.element_to_be_clickable((By.LINK_TEXT, "next"))
-        )
-        next_link.click()
-        # Wait for the page to refresh by waiting until the next_link becomes stale.
-        WebDriverWait(driver, 10).until(EC.staleness_of(next_link))
-        return True
-    except Exception as e:
-        print("No next link found or error clicking next:", e)
-        return False
+    next_links = tree.xpath(NEXT_PAGE_XPATH)
+    return next_links[0] if next_links else None
 
-def scrape_event_details(driver, event_url):
+async def crawl_listing(session, url, max_pages):
     """
-    Navigate to the event URL and extract additional details using BeautifulSoup.
+    Download the wikicfp listing pages over HTTP, following the "next" links,
+    and extract their events.
+    
+    A failure on the first page is raised; on a later page the crawl stops
+    and keeps the events of the pages already processed.
+    
+    Returns:
+        A list of dictionaries containing extracted event data.
+    """
+    all_events = []
+    page_count = 0
+    # Process each page until no "next" link is found or max pages reached.
+    while url:
+        page_count += 1
+        print(f"\nProcessing page {page_count}...")
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)) as response:
+                response.raise_for_status()
+                html = await response.text(errors="replace")
+        except Exception as e:
+            if page_count == 1:
+                raise
+            print(f"Error fetching listing page {page_count}: {e}")
+            print(f"Partial crawl: keeping the {len(all_events)} event(s) of the previous pages.")
+            break
+        tree = lxml.html.fromstring(html, base_url=url)
+        tree.make_links_absolute()
+        all_events.extend(process_data_table(tree))
+        if page_count >= max_pages:
+            print("Maximum page limit reached.")
+            break
+        url = find_next_page(tree)
+        if not url:
+            print("No further pages found. Exiting pagination loop.")
+    return all_events
+
+def parse_detail_html(html):
+    """
+    Extract additional details from the HTML of an event page using lxml.
+    Structural lookups are done with targeted XPath queries and plain-text
+    lookups with regexes on the raw HTML, so no tree-wide scan is needed.
     
     Returns:
         A dictionary containing additional details from the event page.
     """
-    import re  # import pour les expressions régulières
     details = {}
-    try:
-        driver.get(event_url)
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        html = driver.page_source
-        #details["page_content"] = html
-        
-        # Utiliser BeautifulSoup pour parser le contenu HTML
-        soup = BeautifulSoup(html, "html.parser")
-        title_tag = soup.find("title")
-        details["page_title"] = title_tag.text.strip() if title_tag else driver.title
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        details["meta_description"] = meta_desc["content"].strip() if meta_desc and meta_desc.get("content") else "N/A"
-
-        # Extraction du deadline détaillé
-        deadline_match = re.search(r"Deadline\s*:\s*([\w\s,\-]+)", html, re.IGNORECASE)
-        details["detailed_deadline"] = deadline_match.group(1).strip() if deadline_match else "N/A"
-
-        # Extraction du review time
-        review_match = re.search(r"Review Time\s*:\s*([\w\s,\-]+)", html, re.IGNORECASE)
-        details["review_time"] = review_match.group(1).strip() if review_match else "N/A"
-
-        # Extraction du conference rank
-        rank_match = re.search(r"Conference Rank\s*:\s*([\w\s,\-]+)", html, re.IGNORECASE)
-        details["conference_rank"] = rank_match.group(1).strip() if rank_match else "N/A"
-
-        # Détection si l'événement est un workshop (recherche du mot "workshop")
-        details["is_workshop"] = True if soup.find(text=re.compile("workshop", re.IGNORECASE)) else False
-
-        # Extraction du nombre minimum de pages
-        pages_match = re.search(r"Minimum Pages\s*:\s*(\d+)", html, re.IGNORECASE)
-        details["minimum_pages"] = int(pages_match.group(1)) if pages_match else "N/A"
-
-        # Nouvelle extraction : lien du site web de l'événement
-        link_text = soup.find(text=lambda x: x and "Link:" in x)
-        if link_text:
-            parent_td = link_text.find_parent("td")
-            if parent_td:
-                website_a = parent_td.find("a", href=True)
-                details["website_link"] = website_a["href"] if website_a else "N/A"
-            else:
-                details["website_link"] = "N/A"
-        else:
-            details["website_link"] = "N/A"
-
-        # Nouvelle extraction : catégories de l'événement
-        cat_h5 = soup.find("h5")
-        if cat_h5 and "Categories" in cat_h5.get_text():
-            a_tags = cat_h5.find_all("a")
-            # Exclure le lien de l'étiquette "Categories"
-            details["categories"] = [a.get_text(strip=True) for a in a_tags if "Categories" not in a.get_text()]
-        else:
-            details["categories"] = []
+    tree = lxml.html.fromstring(html)
+    title_tag = tree.find(".//title")
+    details["page_title"] = title_tag.text_content().strip() if title_tag is not None else "N/A"
+    meta_desc = tree.xpath("//meta[@name='description']/@content")
+    details["meta_description"] = meta_desc[0].strip() if meta_desc and meta_desc[0] else "N/A"
 
-    except Exception as e:
-        details["error"] = str(e)
+    # Extraction du deadline détaillé
+    deadline_match = _DEADLINE_RE.search(html)
+    details["detailed_deadline"] = deadline_match.group(1).strip() if deadline_match else "N/A"
+
+    # Extraction du review time
+    review_match = _REVIEW_TIME_RE.search(html)
+    details["review_time"] = review_match.group(1).strip() if review_match else "N/A"
+
+    # Extraction du conference rank
+    rank_match = _CONFERENCE_RANK_RE.search(html)
+    details["conference_rank"] = rank_match.group(1).strip() if rank_match else "N/A"
+
+    # Détection si l'événement est un workshop (recherche du mot "workshop")
+    details["is_workshop"] = bool(_WORKSHOP_RE.search(html))
+
+    # Extraction du nombre minimum de pages
+    pages_match = _MINIMUM_PAGES_RE.search(html)
+    details["minimum_pages"] = int(pages_match.group(1)) if pages_match else "N/A"
+
+    # Nouvelle extraction : lien du site web de l'événement
+    website_links = tree.xpath(WEBSITE_LINK_XPATH)
+    details["website_link"] = website_links[0] if website_links else "N/A"
+
+    # Nouvelle extraction : catégories de l'événement
+    cat_h5 = tree.find(".//h5")
+    if cat_h5 is not None and "Categories" in cat_h5.text_content():
+        # Exclure le lien de l'étiquette "Categories"
+        details["categories"] = [
+            a.text_content().strip() for a in cat_h5.iter("a") if "Categories" not in a.text_content()
+        ]
+    else:
+        details["categories"] = []
     return details
 
+async def fetch_detail(session, sem, url):
+    """
+    Download an event page over HTTP and extract its details with parse_detail_html.
+    The semaphore bounds the number of requests in flight.
+    
+    Returns:
+        A dictionary containing additional details from the event page.
+    """
+    try:
+        async with sem, session.get(url, timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT)) as response:
+            response.raise_for_status()
+            html = await response.text(errors="replace")
+        return parse_detail_html(html)
+    except Exception as e:
+        return {"error": str(e)}
+
+async def gather_details(session, urls):
+    """
+    Fetch the detail pages of all URLs concurrently over the given aiohttp session.
+    
+    Returns:
+        A list of detail dictionaries, in the same order as the URLs.
+    """
+    sem = asyncio.Semaphore(DETAIL_CONCURRENCY)
+    return await asyncio.gather(*[fetch_detail(session, sem, url) for url in urls])
+
+async def collect_events(url, max_pages):
+    """
+    Crawl the listing pages, then fetch the detail pages missing from the cache.
+    Both phases share one aiohttp session, so connections to wikicfp opened
+    while crawling the listing are reused for the detail pages.
+    
+    Returns:
+        A list of event dictionaries merged with their details.
+    """
+    connector = aiohttp.TCPConnector(limit=DETAIL_CONCURRENCY)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        all_events = await crawl_listing(session, url, max_pages)
+
+        # Now that we've collected all event data from the table,
+        # fetch each event's detail page concurrently over HTTP (no browser needed).
+        print("\nStarting additional scraping on extracted event URLs...")
+        linked_events = [event for event in all_events if event["link"] and event["link"] != "N/A"]
+        # Les pages déjà en cache ne sont ni retéléchargées ni reparsées
+        details_by_url = load_details_cache()
+        missing_urls = list(dict.fromkeys(
+            event["link"] for event in linked_events if event["link"] not in details_by_url
+        ))
+        cached_count = sum(event["link"] in details_by_url for event in linked_events)
+        print(f"{cached_count} event(s) found in the details cache, "
+              f"{len(missing_urls)} page(s) to fetch.")
+        fetched = dict(zip(missing_urls, await gather_details(session, missing_urls)))
+    # Les erreurs ne sont pas mises en cache pour être retentées au prochain passage
+    store_details_cache({url: details for url, details in fetched.items() if "error" not in details})
+    details_by_url.update(fetched)
+    return [{**event, **details_by_url[event["link"]]} for event in linked_events]
+
+def get_details_cache_file():
+    """Return the path of the SQLite cache of event details, creating its directory if needed."""
+    base_output_dir = os.getenv("DATA_OUTPUT", "data_output")
+    cache_dir = os.path.join(base_output_dir, "cache")
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    return os.path.join(cache_dir, "details.sqlite")
+
+def load_details_cache():
+    """
+    Load the cached event details that are younger than DETAIL_CACHE_TTL.
+    
+    Returns:
+        A dictionary mapping each event URL to its details.
+    """
+    with closing(sqlite3.connect(get_details_cache_file())) as conn:
+        conn.execute(DETAILS_TABLE_SQL)
+        rows = conn.execute(
+            "SELECT url, payload FROM details WHERE fetched_at >= ?",
+            (int(time.time()) - DETAIL_CACHE_TTL,)
+        ).fetchall()
+    return {url: json.loads(payload) for url, payload in rows}
+
+def store_details_cache(details_by_url):
+    """Save the details of each event URL in the SQLite cache."""
+    fetched_at = int(time.time())
+    with closing(sqlite3.connect(get_details_cache_file())) as conn:
+        conn.execute(DETAILS_TABLE_SQL)
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO details (url, payload, fetched_at) VALUES (?, ?, ?)",
+                [(url, json.dumps(details), fetched_at) for url, details in details_by_url.items()]
+            )
+
 # Charger les variables d'environnement depuis .env
 load_dotenv()
 
@@ -204,57 +314,31 @@ def main():
     # URL for the first page (adjust as needed)
     url = "http://www.wikicfp.com/cfp/call?conference=artificial%20intelligence"
     url="http://www.wikicfp.com/cfp/call?conference=computer%20science&skip=1"
-    driver = setup_driver(headless=False)
-    all_events = []
     
     # Charger la variable MAX_PAGES depuis .env (par défaut 5 pages)
     max_pages = int(os.environ.get("MAX_PAGES", 50))
-    page_count = 0
-    
-    try:
-        driver.get(url)
-        # Process each page until no "next" link is found or max pages reached.
-        while True:
-            page_count += 1
-            print(f"\nProcessing page {page_count}...")
-            events = process_data_table(driver)
-            all_events.extend(events)
-            if page_count >= max_pages or not click_next_page(driver):
-                if page_count >= max_pages:
-                    print("Maximum page limit reached.")
-                else:
-                    print("No further pages found. Exiting pagination loop.")
-                break
+    all_events_details = asyncio.run(collect_events(url, max_pages))
+    # Ne jamais écraser une sortie précédente par une liste vide
+    if not all_events_details:
+        raise RuntimeError(f"No events collected from {url}, previous outputs left untouched.")
 
-        # Now that we've collected all event data from the table,
-        # perform additional scraping on each event's detail page.
-        print("\nStarting additional scraping on extracted event URLs...")
-        all_events_details = []
-        for event in all_events:
-            if event["link"] and event["link"] != "N/A":
-                details = scrape_event_details(driver, event["link"])
-                new_details = {**event, **details}
-                all_events_details.append(new_details)
-
-        # Output the complete data in JSON format.
-        json_output = json.dumps(all_events_details, indent=4)
-        # Récupérer le chemin du fichier de sortie depuis .env
-        output_file = os.environ.get('OUTPUT_FILE', 'output.json')
-        with open(output_file, 'w') as f:
-            f.write(json_output)
-        print(f"\nDonnées sauvegardées dans {output_file}")
-
-        # Sauvegarder les données en cache pour rate_events
-        base_output_dir = os.getenv("DATA_OUTPUT", "data_output")
-        cache_dir = os.path.join(base_output_dir, "cache")
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
-        cache_file = os.path.join(cache_dir, "cache_output.json")
-        with open(cache_file, 'w') as cf:
-            cf.write(json_output)
-        print(f"Données mises en cache dans {cache_file}")
-    finally:
-        driver.quit()
+    # Output the complete data in JSON format.
+    json_output = json.dumps(all_events_details, indent=2, ensure_ascii=False)
+    # Récupérer le chemin du fichier de sortie depuis .env
+    output_file = os.environ.get('OUTPUT_FILE', 'output.json')
+    Path(output_file).write_text(json_output, encoding="utf-8")
+    print(f"\nDonnées sauvegardées dans {output_file}")
+
+    # Sauvegarder les données en cache pour rate_events
+    base_output_dir = os.getenv("DATA_OUTPUT", "data_output")
+    cache_dir = os.path.join(base_output_dir, "cache")
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    cache_file = os.path.join(cache_dir, "cache_output.json")
+    # Copie du fichier déjà écrit plutôt qu'un lien : rate_events réécrit
+    # output.json sur place et modifierait aussi le cache
+    shutil.copyfile(output_file, cache_file)
+    print(f"Données mises en cache dans {cache_file}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
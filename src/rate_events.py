@@ -1,32 +1,55 @@
 #!/usr/bin/env python3
 import json
+import math
+import re
 import time
 import os  # ajout de os pour utiliser les variables d'environnement
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import glob
 from pathlib import Path
 from dotenv import load_dotenv  # import ajouté
 import logging
+import lxml.html
+import requests
 
 # Configuration minimale du logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
-def get_core_ranking(conference_name, driver):
-    """
-    Parcourt le portail CORE pour extraire les informations de classement 
-    de la conférence et renvoie un dictionnaire regroupant les données.
-    """
-    search_url = "https://portal.core.edu.au/conf-ranks/"
-    driver.get(search_url)
-    
-    wait = WebDriverWait(driver, 5)  # délai d'attente réduit
-    result = {
+# Délais (en secondes) entre deux essais quand le portail CORE ne répond pas à temps
+CORE_RETRY_DELAYS = (1, 2, 4)
+# Codes HTTP du portail CORE traités comme une limitation de débit : la recherche est retentée
+CORE_RETRY_STATUSES = (429, 503)
+# Attente maximale (en secondes) accordée à un en-tête Retry-After
+CORE_MAX_RETRY_AFTER = 60
+# Délai maximal (en secondes) d'une requête au portail CORE
+CORE_TIMEOUT = 10
+CORE_SEARCH_URL = "https://portal.core.edu.au/conf-ranks/"
+# Lignes de résultats du tableau de recherche CORE
+CORE_ROWS_XPATH = "//table//tr[contains(@class, 'evenrow') or contains(@class, 'oddrow')]"
+
+# Nombre de nouvelles recherches CORE entre deux sauvegardes du cache de ranking
+RANKING_CACHE_FLUSH_EVERY = 10
+# Caractères ignorés dans les clés du cache de ranking (tout sauf lettres et chiffres Unicode)
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+# Une session HTTP par thread (requests.Session n'est pas garantie thread-safe) : dans
+# chaque thread, les connexions au portail CORE restent ouvertes d'une recherche à l'autre
+_thread_local = threading.local()
+
+def get_session():
+    """Renvoie la session HTTP du thread courant, créée au premier appel."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+def empty_core_ranking():
+    """Renvoie le résultat par défaut d'une conférence absente du portail CORE."""
+    return {
         "title": "N/A",
         "acronym": "N/A",
         "source": "N/A",
@@ -38,91 +61,196 @@ def get_core_ranking(conference_name, driver):
         "average_rating": "N/A",
         "found": False
     }
+
+def search_core_ranking(conference_name):
+    """
+    Effectue une recherche sur le portail CORE (simple requête GET) et renvoie
+    les données de la première conférence trouvée. Les erreurs réseau ne sont
+    pas interceptées.
+    """
+    response = get_session().get(CORE_SEARCH_URL, params={"search": conference_name, "by": "all"},
+                                 timeout=CORE_TIMEOUT)
+    response.raise_for_status()
+    tree = lxml.html.fromstring(response.text, base_url=response.url)
+    tree.make_links_absolute()
+    result = empty_core_ranking()
     
-    try:
-        # Recherche de la conférence
-        search_box = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "input[name='search']")))
-        search_box.clear()
-        search_box.send_keys(conference_name)
-        
-        submit_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "input[type='submit'][value='Search']")))
-        submit_button.click()
-        
-        table = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody")),
-                           message="No table found")
-        if "0 Results found." in table.text:
-            logging.info(f"Aucun résultat pour {conference_name} (0 Results found.)")
-            return result
-        
-        rows = table.find_elements(By.CSS_SELECTOR, "tr.evenrow, tr.oddrow")
-        if not rows:
-            logging.info(f"Aucun résultat pour {conference_name}")
-            return result
-        
-        first_row = rows[0]
-        result.update({
-            "title": first_row.find_element(By.XPATH, "./td[1]").text.strip(),
-            "acronym": first_row.find_element(By.XPATH, "./td[2]").text.strip(),
-            "source": first_row.find_element(By.XPATH, "./td[3]").text.strip(),
-            "rank": first_row.find_element(By.XPATH, "./td[4]").text.strip(),
-            "note": first_row.find_element(By.XPATH, "./td[5]").text.strip(),
-            "primary_for": first_row.find_element(By.XPATH, "./td[7]").text.strip(),
-            "comments": first_row.find_element(By.XPATH, "./td[8]").text.strip(),
-            "average_rating": first_row.find_element(By.XPATH, "./td[9]").text.strip(),
-            "found": True
-        })
+    rows = tree.xpath(CORE_ROWS_XPATH)
+    if not rows:
+        logging.info(f"Aucun résultat pour {conference_name}")
+        return result
+    
+    # Toutes les cellules de la première ligne en une seule requête XPath
+    cells = rows[0].xpath("./td")
+    texts = [cell.text_content().strip() for cell in cells]
+    result.update({
+        "title": texts[0],
+        "acronym": texts[1],
+        "source": texts[2],
+        "rank": texts[3],
+        "note": texts[4],
+        "primary_for": texts[6],
+        "comments": texts[7],
+        "average_rating": texts[8],
+        "found": True
+    })
+    dblp_links = cells[5].xpath(".//a/@href")
+    if dblp_links:
+        result["dblp_link"] = dblp_links[0]
+    return result
+
+@lru_cache(maxsize=None)
+def _cached_core_search(conference_name):
+    """
+    Mémoïse search_core_ranking. Une exception n'étant jamais mise en cache,
+    seules les recherches réussies le sont.
+    """
+    return search_core_ranking(conference_name)
+
+def _retry_after(response, default):
+    """
+    Renvoie l'attente (en secondes) demandée par l'en-tête Retry-After de la
+    réponse, bornée par CORE_MAX_RETRY_AFTER, ou default s'il est absent ou illisible.
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return default
+    if value.strip().isdigit():
+        seconds = int(value)
+    else:
         try:
-            dblp_link = first_row.find_element(By.XPATH, ".//td[6]//a").get_attribute("href")
-            result["dblp_link"] = dblp_link
-        except Exception:
-            pass
+            seconds = math.ceil((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return default
+    return min(max(seconds, 0), CORE_MAX_RETRY_AFTER)
+
+def fetch_core_ranking(conference_name):
+    """
+    Renvoie une copie des données CORE de la conférence. Si le portail ne
+    répond pas ou limite le débit (CORE_RETRY_STATUSES), la recherche est
+    retentée après chacun des délais de CORE_RETRY_DELAYS, ou après celui de
+    l'en-tête Retry-After s'il est présent ; l'erreur finale est propagée à l'appelant.
+    """
+    for delay in CORE_RETRY_DELAYS:
+        try:
+            return dict(_cached_core_search(conference_name))
+        except (requests.Timeout, requests.ConnectionError):
+            logging.warning(f"Délai dépassé pour {conference_name}, nouvel essai dans {delay}s")
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in CORE_RETRY_STATUSES:
+                raise
+            delay = _retry_after(e.response, delay)
+            logging.warning(f"CORE a répondu {e.response.status_code} pour {conference_name}, "
+                            f"nouvel essai dans {delay}s")
+        time.sleep(delay)
+    return dict(_cached_core_search(conference_name))
+
+def get_core_ranking(conference_name, driver=None):
+    """
+    Interroge le portail CORE pour extraire les informations de classement 
+    de la conférence et renvoie un dictionnaire regroupant les données.
+    En cas d'échec, renvoie empty_core_ranking() sans le mémoïser : un nouvel
+    appel retentera la recherche. Le paramètre driver n'est plus utilisé et
+    n'est conservé que pour compatibilité.
+    """
+    try:
+        return fetch_core_ranking(conference_name)
     except Exception as e:
         logging.error(f"Erreur lors de la recherche de {conference_name}: {e}")
-    
-    return result
+        return empty_core_ranking()
 
 def extract_conference_name(conf):
     """
     Extrait le nom de la conférence à partir du champ 'page_title'.
     Si 'page_title' n'est pas disponible, utilise 'event_name'.
     """
-    title = conf.get("page_title", "")
+    return _conference_name(conf.get("page_title", ""), conf.get("event_name", ""))
+
+@lru_cache(maxsize=None)
+def _conference_name(title, event_name):
     if title:
         parts = title.split(" ")
         return parts[0].strip() if len(parts) > 1 else title.strip()
-    return conf.get("event_name", "").split(" ")[0]
+    return event_name.split(" ")[0]
+
+def _norm(name):
+    """
+    Normalise un nom de conférence pour en faire une clé du cache de ranking :
+    "ICML", "ICML " et "icml" partagent ainsi la même entrée.
+    Les lettres non ASCII (accents, CJK) sont conservées ; si rien ne reste,
+    le nom brut sans espaces superflus sert de clé.
+    """
+    return _NON_ALNUM_RE.sub("", name.casefold()) or name.strip()
+
+def core_workers():
+    """Nombre de threads de recherche CORE (variable CORE_WORKERS, 4 par défaut)."""
+    return int(os.environ.get("CORE_WORKERS", 4))
+
+def attach_core_rankings(conferences, ranking_cache, executor=None):
+    """
+    Ajoute à chaque conférence ses données de classement CORE.
+    Seules les conférences absentes du cache sont recherchées, en parallèle par
+    CORE_WORKERS threads (4 par défaut) ; si toutes sont en cache, aucune
+    recherche n'est lancée et le cache n'est pas réécrit. Une recherche en
+    échec n'est pas mise en cache : la conférence reçoit empty_core_ranking().
+    Un executor fourni par l'appelant est réutilisé (et laissé ouvert) : ses
+    threads, et donc leurs sessions HTTP, servent alors d'un appel à l'autre.
+    """
+    # Clé normalisée -> premier nom brut rencontré, utilisé pour la recherche CORE
+    uncached_names = {}
+    for conf_name in map(extract_conference_name, conferences):
+        key = _norm(conf_name)
+        if key not in ranking_cache:
+            uncached_names.setdefault(key, conf_name)
+    logging.info(f"{len(uncached_names)} conférence(s) absente(s) du cache de ranking")
+    if uncached_names:
+        cache_lock = threading.Lock()
+        fetched_count = 0
+
+        def lookup(key, conf_name):
+            nonlocal fetched_count
+            logging.info(f"Fetching CORE ranking for: {conf_name}")
+            try:
+                core_data = fetch_core_ranking(conf_name)
+            except Exception as e:
+                # Échec transitoire : rien n'est mis en cache, la recherche sera retentée
+                logging.error(f"Erreur lors de la recherche de {conf_name}: {e}")
+                return
+            logging.info(f"Found ranking: {core_data['rank']} for {conf_name}")
+            with cache_lock:
+                ranking_cache[key] = core_data
+                fetched_count += 1
+                # Stocke le cache régulièrement plutôt qu'après chaque fetch
+                if fetched_count % RANKING_CACHE_FLUSH_EVERY == 0:
+                    store_ranking_cache(ranking_cache)
+
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=min(core_workers(), len(uncached_names)))
+        try:
+            list(executor.map(lookup, uncached_names.keys(), uncached_names.values()))
+        finally:
+            if own_executor:
+                executor.shutdown()
+            # Sauvegarder le cache mis à jour, même si une recherche a échoué
+            store_ranking_cache(ranking_cache)
+    
+    for conf in conferences:
+        core_data = ranking_cache.get(_norm(extract_conference_name(conf)))
+        conf["core_data"] = core_data if core_data is not None else empty_core_ranking()
 
 def enrich_conferences(json_path, output_path):
+    """
+    Ajoute à chaque conférence du fichier les données de classement CORE,
+    en passant par le cache de ranking.
+    """
     # Load the conference data
     with open(json_path, "r", encoding="utf-8") as f:
         conferences = json.load(f)
     
     # Charger le cache de ranking s'il existe, sinon initialiser un cache vide
     ranking_cache = load_ranking_cache() or {}
-    
-    # Set up Selenium with headless Chrome using webdriver-manager.
-    chrome_options = Options()
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    
-    for conf in conferences:
-        conf_name = extract_conference_name(conf)
-        if conf_name in ranking_cache:
-            logging.info(f"Using cached ranking for: {conf_name}")
-            conf["core_data"] = ranking_cache[conf_name]
-        else:
-            logging.info(f"Fetching CORE ranking for: {conf_name}")
-            core_data = get_core_ranking(conf_name, driver)
-            conf["core_data"] = core_data
-            ranking_cache[conf_name] = core_data
-            logging.info(f"Found ranking: {core_data['rank']} for {conf_name}")
-            store_ranking_cache(ranking_cache)  # Stocke le cache après chaque fetch
-            time.sleep(2)
-    
-    driver.quit()
-    
-    # Sauvegarder le cache mis à jour
-    store_ranking_cache(ranking_cache)
+    attach_core_rankings(conferences, ranking_cache)
     
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(conferences, f, indent=2, ensure_ascii=False)
@@ -138,12 +266,10 @@ def process_all_json_files(input_dir="output_json", output_dir="data_output/enri
     json_files = glob.glob(f"{input_dir}/*.json")
     logging.info(f"Found {len(json_files)} JSON files to process")
     
-    # Set up Chrome driver once for all files
-    chrome_options = Options()
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    
-    try:
+    # Le cache de ranking et le pool de recherche CORE (threads et sessions HTTP)
+    # sont partagés par tous les fichiers
+    ranking_cache = load_ranking_cache() or {}
+    with ThreadPoolExecutor(max_workers=core_workers()) as executor:
         for json_file in json_files:
             logging.info(f"\nProcessing {json_file}")
             # Create output filename
@@ -154,21 +280,12 @@ def process_all_json_files(input_dir="output_json", output_dir="data_output/enri
                 conferences = json.load(f)
             
             # Enrich each conference in the file
-            for conf in conferences:
-                conf_name = extract_conference_name(conf)
-                logging.info(f"Fetching CORE ranking for: {conf_name}")
-                core_data = get_core_ranking(conf_name, driver)
-                conf["core_data"] = core_data
-                logging.info(f"Found ranking: {core_data['rank']} for {conf_name}")
-                time.sleep(2)  # Be polite to the server
+            attach_core_rankings(conferences, ranking_cache, executor)
             
             # Save enriched data
             with open(output_file, "w", encoding="utf-8") as f:
                 json.dump(conferences, f, indent=2, ensure_ascii=False)
             logging.info(f"Saved enriched data to {output_file}")
-            
-    finally:
-        driver.quit()
 
 def rate_events(events):
     """
@@ -184,25 +301,29 @@ def rate_events(events):
 def load_ranking_cache():
     """
     Charge le cache des classements depuis un fichier JSON.
+    Les clés sont normalisées, y compris celles des caches écrits avec les noms bruts.
     """
     base_output_dir = os.getenv("DATA_OUTPUT", "data_output")
     cache_file = os.path.join(base_output_dir, "cache", "ranking_cache.json")
     if os.path.exists(cache_file):
         with open(cache_file, "r", encoding="utf-8") as file:
-            return json.load(file)
+            return {_norm(name): core_data for name, core_data in json.load(file).items()}
     return {}
 
 def store_ranking_cache(cache):
     """
     Sauvegarde le cache des classements dans un fichier JSON.
+    Le fichier est écrit à côté puis renommé, pour ne jamais laisser un cache tronqué.
     """
     base_output_dir = os.getenv("DATA_OUTPUT", "data_output")
     cache_dir = os.path.join(base_output_dir, "cache")
     if not os.path.exists(cache_dir):
         os.makedirs(cache_dir)
     cache_file = os.path.join(cache_dir, "ranking_cache.json")
-    with open(cache_file, "w", encoding="utf-8") as file:
+    tmp_file = cache_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as file:
         json.dump(cache, file, ensure_ascii=False, indent=4)
+    os.replace(tmp_file, cache_file)
 
 def get_raw_results():
     # ...existing code utilisant Selenium pour récupérer les résultats bruts...
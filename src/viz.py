@@ -1,6 +1,11 @@
-import json
+import functools
 import os
+import numpy as np
+import orjson
+import re
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # Rendu fichier uniquement : pas de backend graphique
 import matplotlib.pyplot as plt
 import seaborn as sns      # Pour le style des graphiques
 import geopandas as gpd
@@ -9,18 +14,44 @@ from matplotlib.ticker import FuncFormatter
 import matplotlib.patches as mpatches  # Ajout de l'import pour les légendes
 import logging
 import sys
+from pathlib import Path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 import gather_events
 import rate_events as rate_events
 
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
+plt.ioff()
+
+# Mapping des couleurs par rang (constant) et légende associée, construite une seule fois
+RANK_COLORS = {
+    "Unknown": "dodgerblue",
+    "A*": "darkred",
+    "A": "crimson",
+    "B": "gold",
+    "C": "lightgreen"
+}
+LEGEND_HANDLES = [mpatches.Patch(color=color, label=rank) for rank, color in RANK_COLORS.items()]
+
+# Fichier effectivement lu par prepare_data
+RATED_EVENTS_FILE = "data_output/rated_events.json"
+# Marqueur écrit dans le dossier des graphiques une fois qu'ils ont tous été générés
+CHARTS_STAMP = ".charts_complete"
 
 def make_cfp_unique(df):
     """
-    Supprime les doublons dans le DataFrame basé sur le nom de l'événement et la date de soumission.
+    Supprime les doublons dans le DataFrame : d'abord les événements partageant
+    le même lien wikicfp, puis ceux dont le nom normalisé (minuscules, espaces
+    réduits) et le mois de la date de soumission coïncident.
     """
-    df_unique = df.drop_duplicates(subset=["event_name", "submission_deadline"])
-    return df_unique
+    # Masques booléens plutôt que drop_duplicates, qui recopie le DataFrame en interne
+    if "link" in df.columns:
+        links = df["link"]
+        df = df.loc[~(links.duplicated(keep="first") & links.notna() & links.ne("N/A"))]
+    keys = pd.DataFrame({
+        "name": df["event_name"].str.lower().str.replace(r"\s+", " ", regex=True).str.strip(),
+        "month": df["submission_deadline"].dt.to_period("M"),
+    })
+    return df.loc[~keys.duplicated(keep="first")]
 
 def prepare_data(filename="data_output/rated_events.json"):
     """
@@ -30,45 +61,40 @@ def prepare_data(filename="data_output/rated_events.json"):
     sns.set_style("whitegrid")
     sns.set_palette("pastel")
     filename = "data_output/output.json"
-    filename = "data_output/rated_events.json"
+    filename = RATED_EVENTS_FILE
 
     # Chargement des données
     try:
-        with open(filename, "r", encoding="utf-8") as file:
-            conferences = json.load(file)
+        with open(filename, "rb") as file:
+            conferences = orjson.loads(file.read())
     except FileNotFoundError as e:
         logging.error(f"Could not open file '{filename}': {e}")
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), [], {}, [], []
-    except json.JSONDecodeError as e:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}
+    except orjson.JSONDecodeError as e:
         logging.error(f"Invalid JSON in file '{filename}': {e}")
-        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), [], {}, [], []
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), {}
 
     # Transformation en DataFrame et adaptation des clés
     df = pd.DataFrame(conferences)
     df = df.rename(columns={"where": "location", "deadline": "submission_deadline"})
-    df["submission_deadline"] = pd.to_datetime(df["submission_deadline"], errors="coerce")
+    # Format fixe (celui de gather_events.format_deadline) : évite l'inférence ligne par ligne
+    df["submission_deadline"] = pd.to_datetime(df["submission_deadline"], format="%d/%m/%y", errors="coerce")
     # Suppression des lignes sans date de soumission
     df = df[df["submission_deadline"].notna()]
-    # Gestion de l'absence de core_data
-    df["rank"] = df.apply(
-        lambda row: row["core_data"]["rank"] if "core_data" in row and isinstance(row["core_data"], dict) and "rank" in row["core_data"] else "Unknown",
-        axis=1
-    )
+    # Gestion de l'absence de core_data (sans apply(axis=1), qui construit une Series par ligne)
+    core_data = df["core_data"].to_numpy() if "core_data" in df.columns else [None] * len(df)
+    df["rank"] = [cd.get("rank", "Unknown") if isinstance(cd, dict) else "Unknown" for cd in core_data]
 
     if df.empty:
         logging.warning("DataFrame is empty after loading data.")
 
     # Rendre les CFP uniques
     df = make_cfp_unique(df)
+    # Catégories jointes en minuscules, calculées une seule fois pour tous les filtres
+    df["categories_lc"] = _join_categories(df["categories"])
 
     # Mapping des couleurs par rang
-    rank_colors = {
-        "Unknown": "dodgerblue",
-        "A*": "darkred",
-        "A": "crimson",
-        "B": "gold",
-        "C": "lightgreen"
-    }
+    rank_colors = RANK_COLORS
 
     # Création du diagramme de Gantt de base
     df_sorted = df.sort_values("submission_deadline")
@@ -76,11 +102,86 @@ def prepare_data(filename="data_output/rated_events.json"):
     df_sorted['end_date'] = df_sorted['start_date'] + pd.Timedelta(days=1)
     mask = df_sorted['start_date'].notna() & df_sorted['end_date'].notna()
     gantt_df = df_sorted[mask].reset_index(drop=True)
-    y_pos = range(len(gantt_df))
-    durations = [(end - start).days for start, end in zip(gantt_df['start_date'], gantt_df['end_date'])]
-    gantt_colors = gantt_df["rank"].apply(lambda r: rank_colors.get(r, "dodgerblue")).tolist()
 
-    return df, df_sorted, gantt_df, durations, rank_colors, y_pos, gantt_colors
+    return df, df_sorted, gantt_df, rank_colors
+
+@functools.lru_cache(maxsize=1)
+def _world():
+    """Charge une seule fois le fond de carte naturalearth_lowres."""
+    return gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
+
+def _join_categories(categories):
+    """
+    Joint les catégories de chaque événement en une seule chaîne minuscule,
+    sur laquelle les filtres peuvent ensuite travailler avec les méthodes .str.
+    """
+    return categories.map(
+        lambda x: "|".join(str(cat) for cat in x).lower() if isinstance(x, list) else str(x).lower()
+    )
+
+def _bar_positions(starts, ends):
+    """
+    Calcule, sur des tableaux NumPy datetime64, la durée en jours entiers de
+    chaque barre et l'instant médian où placer son annotation.
+    """
+    durations = (ends - starts) // np.timedelta64(1, "D")
+    mid_times = starts + durations * np.timedelta64(12, "h")
+    return durations, mid_times
+
+def _render_gantt(ax, df, title, path, rank_colors, show_rank=True):
+    """
+    Trace le diagramme de Gantt des événements de df sur ax et enregistre sa
+    figure dans path. L'axe est vidé au préalable, ce qui permet de réutiliser
+    la même figure pour plusieurs graphiques.
+    Chaque barre est annotée du nombre minimum de pages (suivi du rang si
+    show_rank) et de la mention "Workshop" le cas échéant.
+    Les valeurs annotées sont extraites une fois en tableaux NumPy avant la
+    boucle de tracé, sans construire de Series par ligne.
+    Renvoie True si le graphique a bien été enregistré.
+    """
+    n = len(df)
+    durations, mid_times = _bar_positions(df['start_date'].to_numpy(), df['end_date'].to_numpy())
+    pages = df["minimum_pages"].to_numpy() if "minimum_pages" in df.columns else ["N/A"] * n
+    ranks = df["rank"].to_numpy()
+    is_workshop = df["categories_lc"].str.contains("workshop", regex=False).to_numpy()
+    colors = df["rank"].map(rank_colors).fillna("dodgerblue").to_numpy()
+
+    ax.clear()
+    ax.barh(range(n), durations, left=df['start_date'], color=colors)
+    ax.set_yticks(range(n), df["event_name"])
+    ax.set_xlabel("Date")
+    ax.set_title(title)
+    ax.grid(axis="x", linestyle="--", alpha=0.7)
+    # Ajout de la légende pour les couleurs associées aux rangs
+    ax.legend(handles=LEGEND_HANDLES, title="Rank")
+    ax.xaxis_date()
+    ax.xaxis.set_major_formatter(mdates.DateFormatter("%d/%m/%y"))
+    for y, mid_time, min_pages, conf_rank, workshop in zip(range(n), mid_times, pages, ranks, is_workshop):
+        label = f"{min_pages}, {conf_rank}" if show_rank else str(min_pages)
+        ax.text(mid_time, y, label, color="black", va="center", ha="center", fontsize=8)
+        # Annotation si "workshop" dans les catégories
+        if workshop:
+            ax.text(mid_time, y, "Workshop", color="blue", va="bottom", ha="center", fontsize=8)
+    ax.figure.tight_layout()
+    try:
+        ax.figure.savefig(path)
+        logging.info(f"File saved: {path}")
+        return True
+    except Exception as e:
+        logging.error(f"Error while saving chart: {e}")
+        return False
+
+def _charts_up_to_date(stamp_path, input_path):
+    """
+    Indique si le marqueur stamp_path, écrit après le dernier graphique, est plus
+    récent que le fichier d'entrée et que ce script : dans ce cas les graphiques
+    n'ont pas besoin d'être régénérés.
+    """
+    try:
+        chart_mtime = os.path.getmtime(stamp_path)
+        return chart_mtime > max(os.path.getmtime(input_path), os.path.getmtime(__file__))
+    except OSError:
+        return False
 
 # Script prêt à être publié (distribution externe)
 
@@ -92,123 +193,82 @@ def create_all_charts():
     """
     input_filename = os.getenv("INPUT_FILE", "rated_events.json")
     base_output_dir = os.getenv("DATA_OUTPUT", "data_output")
-    output_dir = os.path.join(base_output_dir, "graphs")
+    output_dir = Path(base_output_dir) / "graphs"
+    stamp_path = output_dir / CHARTS_STAMP
+    if _charts_up_to_date(stamp_path, RATED_EVENTS_FILE):
+        logging.info(f"Charts in '{output_dir}' are up to date, skipping chart creation.")
+        return
+    # Invalide le marqueur : il n'est réécrit que si tous les graphiques réussissent
+    stamp_path.unlink(missing_ok=True)
     # Charger les données depuis le fichier défini par l’ENV
-    df, df_sorted, gantt_df, durations, rank_colors, y_pos, gantt_colors = prepare_data(input_filename)
+    df, df_sorted, gantt_df, rank_colors = prepare_data(input_filename)
     logging.info("Starting chart creation process.")
     if df is None or df.empty:
         logging.warning("No data available for chart creation.")
         return
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Une seule figure pour les deux diagrammes de Gantt globaux
+    fig, ax = plt.subplots(figsize=(12, 6))
     # Création du premier graphique Gantt
-    plt.figure(figsize=(12, 6))
-    plt.barh(list(y_pos), durations, left=gantt_df['start_date'], color=gantt_colors)
-    plt.yticks(list(y_pos), gantt_df["event_name"])
-    plt.xlabel("Date")
-    plt.title("Gantt Chart of Conference Event Duration")
-    plt.grid(axis="x", linestyle="--", alpha=0.7)
-    # Ajout de la légende pour les couleurs associées aux rangs
-    legend_handles = [mpatches.Patch(color=rank_colors[key], label=key) for key in rank_colors]
-    plt.legend(handles=legend_handles, title="Rank")
-    plt.gca().xaxis_date()
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter("%d/%m/%y"))
-    for idx, row in gantt_df.iterrows():
-        duration = (row['end_date'] - row['start_date']).days
-        mid_time = row['start_date'] + pd.Timedelta(days=duration/2)
-        min_pages = row.get("minimum_pages", "N/A")
-        plt.text(mid_time, idx, str(min_pages), color="black", va="center", ha="center", fontsize=8)
-        # Annotation si "workshop" dans les catégories
-        if any("workshop" in cat.lower() for cat in row.get("categories", [])):
-            plt.text(mid_time, idx, "Workshop", color="blue", va="bottom", ha="center", fontsize=8)
-    plt.tight_layout()
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    try:
-        plt.savefig(os.path.join(output_dir, "wholeCfp.png"))
-        logging.info(f"File saved: {os.path.join(output_dir, 'wholeCfp.png')}")
-    except Exception as e:
-        logging.error(f"Error while saving chart: {e}")
-    plt.close()
+    all_saved = _render_gantt(ax, gantt_df, "Gantt Chart of Conference Event Duration",
+                  output_dir / "wholeCfp.png", rank_colors, show_rank=False)
 
     # Nouveau graphique : filtré par "database" et "data mining"
     filter_keywords = ["database", "data mining", "pattern recognition", "big data", "computer science"]
-    db_gantt = gantt_df[gantt_df["categories"].apply(
-        lambda x: any(any(keyword in str(cat).lower() for keyword in filter_keywords)
-                    for cat in (x if isinstance(x, list) else str(x).split(',')))
-    )]
-    y_pos_db = range(len(db_gantt))
-    durations_db = [(end - start).days for start, end in zip(db_gantt['start_date'], db_gantt['end_date'])]
-    database_colors = db_gantt["rank"].apply(lambda r: rank_colors.get(r, "dodgerblue")).tolist()
-
-    plt.figure(figsize=(12, 6))
-    plt.barh(list(y_pos_db), durations_db, left=db_gantt['start_date'], color=database_colors)
-    plt.yticks(list(y_pos_db), db_gantt["event_name"])
-    plt.xlabel("Date")
-    plt.title("Gantt Chart of Conference Event Duration (Database)")
-    plt.grid(axis="x", linestyle="--", alpha=0.7)
-    # Ajout de la légende pour les couleurs associées aux rangs (Database)
-    legend_handles = [mpatches.Patch(color=rank_colors[key], label=key) for key in rank_colors]
-    plt.legend(handles=legend_handles, title="Rank")
-    plt.gca().xaxis_date()
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter("%d/%m/%y"))
-
-    def annotate_bar(idx, row):
-        """Ajoute une annotation combinant 'minimum_pages' et 'rank' à la barre."""
-        duration = (row['end_date'] - row['start_date']).days
-        mid_time = row['start_date'] + pd.Timedelta(days=duration / 2)
-        min_pages = row.get("minimum_pages", "N/A")
-        conf_rank = row.get("rank", "Unknown")
-        plt.text(mid_time, idx, f"{min_pages}, {conf_rank}", color="black", va="center", ha="center", fontsize=8)
-
-    for idx, row in db_gantt.iterrows():
-        annotate_bar(idx, row)
-        # Annotation si "workshop" dans les catégories
-        if any("workshop" in cat.lower() for cat in row.get("categories", [])):
-            duration = (row['end_date'] - row['start_date']).days
-            mid_time = row['start_date'] + pd.Timedelta(days=duration / 2)
-            plt.text(mid_time, idx, "Workshop", color="blue", va="bottom", ha="center", fontsize=8)
-
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "filtered_by_categories.png"))
-    plt.close()
+    # Une seule recherche vectorisée sur les catégories jointes de prepare_data
+    keywords_pattern = "|".join(re.escape(keyword) for keyword in filter_keywords)
+    db_gantt = gantt_df[gantt_df["categories_lc"].str.contains(keywords_pattern, regex=True, na=False)]
+    all_saved &= _render_gantt(ax, db_gantt, "Gantt Chart of Conference Event Duration (Database)",
+                  output_dir / "filtered_by_categories.png", rank_colors)
+    plt.close(fig)
 
     # Graphique en barres pour la répartition des rangs
     plt.figure(figsize=(10, 6))
-    ranking_counts = df["rank"].value_counts().sort_values()
+    # Comptage sur un rang catégoriel : ordre stable (celui de rank_colors, puis les
+    # autres rangs observés) au lieu d'un tri par effectif
+    extra_ranks = sorted(set(df["rank"].unique()) - set(rank_colors))
+    rank_dtype = pd.CategoricalDtype(list(rank_colors) + extra_ranks, ordered=True)
+    ranking_counts = df["rank"].astype(rank_dtype).value_counts(sort=False)
+    ranking_counts = ranking_counts[ranking_counts > 0]
     bar_colors = [rank_colors.get(rank, "dodgerblue") for rank in ranking_counts.index]
     ranking_counts.plot(kind="barh", color=bar_colors)
     plt.xlabel("Count")
     plt.ylabel("Rank")
     plt.title("Conference Rankings Distribution")
     plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, "rank_distribution.png"))
+    plt.savefig(output_dir / "rank_distribution.png")
     plt.close()
 
     # Carte des emplacements des conférences
-    def simulate_geocode(loc):
-        try:
-            lat, lon = map(float, loc.split(","))
-            return lat, lon
-        except:
-            return None
-
-    coords = df["location"].dropna().apply(simulate_geocode).dropna()
+    # Seules les localisations de la forme "lat,lon" sont retenues (découpage vectorisé)
+    # reindex complète les colonnes absentes (aucune virgule, aucune localisation) ;
+    # astype(object) garde l'accesseur .str utilisable sur ces colonnes vides
+    coords = df["location"].dropna().astype(str).str.split(",", n=1, expand=True)
+    coords = coords.reindex(columns=[0, 1]).astype(object)
+    coords.columns = ["lat", "lon"]
+    coords = coords.apply(lambda col: pd.to_numeric(col.str.strip(), errors="coerce")).dropna()
     if not coords.empty:
-        lats, lons = zip(*coords)
-        world = gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
+        lats = coords["lat"].to_numpy()
+        lons = coords["lon"].to_numpy()
         fig, ax = plt.subplots(figsize=(12, 8))
-        world.plot(ax=ax, color="lightgray", edgecolor="white")
+        _world().plot(ax=ax, color="lightgray", edgecolor="white")
         ax.scatter(lons, lats, color="red", s=50, zorder=5)
         plt.title("Conference Locations")
         plt.xlabel("Longitude")
         plt.ylabel("Latitude")
         plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, "conference_locations.png"))
+        plt.savefig(output_dir / "conference_locations.png")
         plt.close()
     else:
         print("No valid location data for mapping.")
 
     # Création des graphiques mensuels
-    plot_monthly_gantt(df_sorted, rank_colors)
+    all_saved &= plot_monthly_gantt(df_sorted, rank_colors)
+
+    if all_saved:
+        stamp_path.touch()
+    else:
+        logging.warning("Some charts could not be saved, they will be regenerated on the next run.")
 
 # Commenter ou supprimer l'importation de ace_tools
 # import ace_tools as tools
@@ -241,12 +301,12 @@ def plot_monthly_gantt(df, rank_colors):
     Args:
         df (pd.DataFrame): DataFrame contenant les informations des événements.
         rank_colors (dict): Dictionnaire de mappage entre rang et couleur.
+
+    Returns:
+        bool: True si tous les graphiques mensuels ont été enregistrés.
     """
-    import os  # s'assurer que os est importé
-    base_output_dir = os.getenv("DATA_OUTPUT", "data_output")
-    graphs_dir = os.path.join(base_output_dir, "graphs/by_months")
-    if not os.path.exists(graphs_dir):
-        os.makedirs(graphs_dir)
+    graphs_dir = Path(os.getenv("DATA_OUTPUT", "data_output")) / "graphs" / "by_months"
+    graphs_dir.mkdir(parents=True, exist_ok=True)
     # Filtrer les événements ayant start_date, end_date et submission_deadline valides
     mask = df['start_date'].notna() & df['end_date'].notna() & df['submission_deadline'].notna()
     valid_df = df[mask]
@@ -254,34 +314,15 @@ def plot_monthly_gantt(df, rank_colors):
     #valid_df = valid_df[valid_df["submission_deadline"].dt.month.isin([2, 3, 4])]
     # Groupement par mois basé sur submission_deadline
     grouped = valid_df.groupby(valid_df["submission_deadline"].dt.to_period("M"))
+    # Figure créée une seule fois puis vidée à chaque mois
+    fig, ax = plt.subplots(figsize=(12, 6))
+    all_saved = True
     for period, group in grouped:
         print(f"[DEBUG] Processing period: {period} with {len(group)} events")  # debug statement ajouté
-        y_pos_month = range(len(group))
-        durations_month = [(end - start).days for start, end in zip(group['start_date'], group['end_date'])]
-        monthly_colors = group["rank"].apply(lambda r: rank_colors.get(r, "dodgerblue")).tolist()
-        plt.figure(figsize=(12, 6))
-        plt.barh(list(y_pos_month), durations_month, left=group['start_date'], color=monthly_colors)
-        plt.yticks(list(y_pos_month), group["event_name"])
-        plt.xlabel("Date")
-        plt.title(f"Gantt Chart for {period} (Monthly)")
-        plt.grid(axis="x", linestyle="--", alpha=0.7)
-        legend_handles = [mpatches.Patch(color=rank_colors[key], label=key) for key in rank_colors]
-        plt.legend(handles=legend_handles, title="Rank")
-        plt.gca().xaxis_date()
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter("%d/%m/%y"))
-        # Annotation (même logique que “db_gantt”)
-        for idx, row in group.iterrows():
-            duration = (row['end_date'] - row['start_date']).days
-            mid_time = row['start_date'] + pd.Timedelta(days=duration / 2)
-            min_pages = row.get("minimum_pages", "N/A")
-            conf_rank = row.get("rank", "Unknown")
-            plt.text(mid_time, idx, f"{min_pages}, {conf_rank}", color="black", va="center", ha="center", fontsize=8)
-            if any("workshop" in cat.lower() for cat in row.get("categories", [])):
-                plt.text(mid_time, idx, "Workshop", color="blue", va="bottom", ha="center", fontsize=8)
-        plt.tight_layout()
-        file_path = os.path.join(graphs_dir, f"gantt_{period}.png")
-        plt.savefig(file_path)
-        plt.close()
+        all_saved &= _render_gantt(ax, group, f"Gantt Chart for {period} (Monthly)",
+                                   graphs_dir / f"gantt_{period}.png", rank_colors)
+    plt.close(fig)
+    return all_saved
 
 def main():
     """
@@ -292,8 +333,8 @@ def main():
     - Sauvegarde le DataFrame final en CSV et JSON.
     """
     # Charger les données depuis output.json
-    with open("output.json", "r") as f:
-        events = json.load(f)
+    with open("output.json", "rb") as f:
+        events = orjson.loads(f.read())
     
     target_categories = ["database", "data mining"]
     filtered_events = filter_events_by_category(events, target_categories)
@@ -307,18 +348,19 @@ def main():
     # print("\nAffichage d'un graphique par mois :")
     create_all_charts()
     
-    # Charger les données curatées depuis output.json
-    with open("output.json", "r", encoding="utf-8") as file:
-        data = json.load(file)
-    df = pd.DataFrame(data)
+    # Données curatées : output.json a déjà été chargé plus haut
+    df = pd.DataFrame(events)
     # ...eventuelles transformations sur df...
-    base_output_dir = os.getenv("DATA_OUTPUT", "data_output")
-    df.to_csv(os.path.join(base_output_dir, "curated_df.csv"), index=False)
-    print(f"Le DataFrame curaté a été sauvegardé dans '{os.path.join(base_output_dir, 'curated_df.csv')}'")
+    base_output_dir = Path(os.getenv("DATA_OUTPUT", "data_output"))
+    csv_path = base_output_dir / "curated_df.csv"
+    df.to_csv(csv_path, index=False)
+    print(f"Le DataFrame curaté a été sauvegardé dans '{csv_path}'")
     
     # Nouvelle sortie en JSON
-    df.to_json(os.path.join(base_output_dir, "curated_df.json"), orient="records", indent=4)
-    print(f"Le DataFrame curaté a été sauvegardé dans '{os.path.join(base_output_dir, 'curated_df.json')}'")
+    json_path = base_output_dir / "curated_df.json"
+    # orjson sérialise les enregistrements bien plus vite que DataFrame.to_json
+    json_path.write_bytes(orjson.dumps(df.to_dict(orient="records"), option=orjson.OPT_INDENT_2))
+    print(f"Le DataFrame curaté a été sauvegardé dans '{json_path}'")
 
 if __name__ == "__main__":
     main()